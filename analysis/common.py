@@ -9,9 +9,10 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from .config_parser import ConfigParser
+if TYPE_CHECKING:
+    from .config_parser import ConfigParser
 
 
 def setup_analysis_cli(description: str) -> argparse.Namespace:
@@ -34,7 +35,7 @@ def setup_analysis_cli(description: str) -> argparse.Namespace:
     return parser.parse_args()
 
 
-def load_configuration(quick_mode: bool) -> ConfigParser:
+def load_configuration(quick_mode: bool) -> "ConfigParser":
     """
     Load configuration based on analysis mode.
 
@@ -48,6 +49,9 @@ def load_configuration(quick_mode: bool) -> ConfigParser:
         FileNotFoundError: If configuration file doesn't exist
         Exception: If configuration loading fails
     """
+    # Deferred so importing an analysis module does not pull in PyYAML
+    from .config_parser import ConfigParser
+
     try:
         config_file = "configs/bench-quick.yaml" if quick_mode else "configs/bench.yaml"
         config_parser = ConfigParser(config_path=config_file).load()
@@ -109,8 +113,9 @@ def load_latest_results(quick_mode: bool) -> tuple[Path, dict[str, Any]]:
 
         latest_file = max(filtered_files, key=lambda x: x.stat().st_mtime)
 
-        with open(latest_file) as f:
-            raw_data = json.load(f)
+        # Parse the raw bytes; json decodes UTF-8 itself, skipping the text
+        # layer's decoding and newline translation
+        raw_data = json.loads(latest_file.read_bytes())
 
         print(f"✅ Loaded raw benchmark data from {latest_file}")
         return latest_file, raw_data
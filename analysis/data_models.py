@@ -118,7 +118,7 @@ class PlotsConfiguration:
     color_scheme: dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationConfiguration:
     """Simplified validation configuration for engineering reliability"""
 
@@ -130,7 +130,7 @@ class ValidationConfiguration:
     sample_limit: int = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsistencyResult:
     """
     Structured consistency validation result
@@ -151,7 +151,7 @@ class ConfigurationData:
     validation: ValidationConfiguration
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkSample:
     """Single benchmark execution sample"""
 
@@ -198,7 +198,7 @@ class RawBenchmarkData:
     load_timestamp: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Aggregated results for a specific task-language-scale combination"""
 
@@ -260,7 +260,7 @@ class QualityAssessment:
     quality_stats: dict[str, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class TTestResult:
     """Results from Welch's t-test statistical comparison"""
 
@@ -274,7 +274,7 @@ class TTestResult:
     alpha: float
 
 
-@dataclass
+@dataclass(slots=True)
 class EffectSizeResult:
     """Cohen's d effect size calculation results"""
 
@@ -286,7 +286,7 @@ class EffectSizeResult:
     meets_minimum_detectable_effect: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class StatisticalResult:
     """Basic statistical measures for a dataset"""
 
@@ -573,7 +573,7 @@ class ComparisonResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Benchmark implementation validation results"""
 
@@ -10,6 +10,7 @@ statistical comparisons of performance metrics across multiple benchmark scenari
 
 import logging
 import os
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -597,17 +598,13 @@ class DecisionSummaryGenerator:
     ) -> dict[str, str]:
         """Generate primary recommendation based on analysis."""
 
-        # Count wins for each language
-        rust_execution_wins = sum(
-            1 for r in results if r.execution_time_winner == "rust"
-        )
-        rust_memory_wins = sum(1 for r in results if r.memory_usage_winner == "rust")
-        tinygo_execution_wins = sum(
-            1 for r in results if r.execution_time_winner == "tinygo"
-        )
-        tinygo_memory_wins = sum(
-            1 for r in results if r.memory_usage_winner == "tinygo"
-        )
+        # Count wins for each language with one aggregation per metric
+        execution_wins = Counter(r.execution_time_winner for r in results)
+        memory_wins = Counter(r.memory_usage_winner for r in results)
+        rust_execution_wins = execution_wins["rust"]
+        rust_memory_wins = memory_wins["rust"]
+        tinygo_execution_wins = execution_wins["tinygo"]
+        tinygo_memory_wins = memory_wins["tinygo"]
 
         rust_total_wins = rust_execution_wins + rust_memory_wins
         tinygo_total_wins = tinygo_execution_wins + tinygo_memory_wins
@@ -29,6 +29,7 @@ from .data_models import (
     MetricType,
     PerformanceStatistics,
     PlotsConfiguration,
+    SignificanceCategory,
     StatisticalResult,
     TTestResult,
 )
@@ -158,6 +159,7 @@ class VisualizationGenerator:
             "tinygo_errors": [],
             "tinygo_cvs": [],
             "significance_categories": [],
+            "winners": [],
         }
 
         for comparison in comparisons:
@@ -172,12 +174,14 @@ class VisualizationGenerator:
                 significance_category = (
                     comparison.execution_time_comparison.significance_category
                 )
+                winner = comparison.execution_time_winner
             else:  # memory_usage
                 rust_stats = comparison.rust_performance.memory_usage
                 tinygo_stats = comparison.tinygo_performance.memory_usage
                 significance_category = (
                     comparison.memory_usage_comparison.significance_category
                 )
+                winner = comparison.memory_usage_winner
 
             # Extract mean, median, and coefficient of variation
             data["rust_means"].append(rust_stats.mean)
@@ -195,6 +199,7 @@ class VisualizationGenerator:
             data["tinygo_errors"].append(tinygo_std_err)
 
             data["significance_categories"].append(significance_category)
+            data["winners"].append(winner)
 
         return data
 
@@ -266,31 +271,18 @@ class VisualizationGenerator:
 
         return x
 
-    def _add_significance_markers(
-        self,
-        ax,
-        data: dict,
-        comparisons: list[ComparisonResult],
-        metric_type: str,
-    ) -> None:
+    def _add_significance_markers(self, ax, data: dict) -> None:
         """
         Add simplified significance markers to chart.
 
         Args:
             ax: Matplotlib axes object
             data: Dictionary containing statistical data
-            comparisons: List of comparison results
-            metric_type: Type of metric for winner determination
         """
         # Add only simple significance indicators for strong evidence
-        for i, comparison in enumerate(comparisons):
-            comparison_obj = getattr(comparison, f"{metric_type}_comparison")
-
+        for i, significance_category in enumerate(data["significance_categories"]):
             # Only mark cases with both statistical significance AND large effect
-            if (
-                comparison_obj.is_significant
-                and comparison_obj.effect_size.effect_size.value in ["medium", "large"]
-            ):
+            if significance_category == SignificanceCategory.STRONG_EVIDENCE:
 
                 max_height = max(
                     data["rust_means"][i] + data["rust_errors"][i],
@@ -365,30 +357,23 @@ class VisualizationGenerator:
 
         ax.legend(handles=legend_elements, loc="upper left", bbox_to_anchor=(1.02, 1))
 
-    def _add_statistical_note(
-        self, fig, comparisons: list[ComparisonResult], metric_type: str
-    ) -> None:
+    def _add_statistical_note(self, fig, data: dict) -> None:
         """
         Add statistical summary note below the chart.
 
         Args:
             fig: Matplotlib figure object
-            comparisons: List of comparison results
-            metric_type: Type of metric for analysis
+            data: Dictionary containing statistical data
         """
         # Count significant results
         significant_count = 0
         rust_wins = 0
         tinygo_wins = 0
 
-        for comparison in comparisons:
-            comparison_obj = getattr(comparison, f"{metric_type}_comparison")
-            winner = getattr(comparison, f"{metric_type}_winner")
-
-            if (
-                comparison_obj.is_significant
-                and comparison_obj.effect_size.effect_size.value in ["medium", "large"]
-            ):
+        for significance_category, winner in zip(
+            data["significance_categories"], data["winners"], strict=True
+        ):
+            if significance_category == SignificanceCategory.STRONG_EVIDENCE:
                 significant_count += 1
 
                 if winner == "rust":
@@ -397,7 +382,7 @@ class VisualizationGenerator:
                     tinygo_wins += 1
 
         # Create summary text
-        total_comparisons = len(comparisons)
+        total_comparisons = len(data["significance_categories"])
         note_text = (
             f"Statistical Summary: {significant_count}/{total_comparisons} comparisons "
             f"show statistically significant differences (p<0.05) with medium/large effect sizes. "
@@ -492,13 +477,13 @@ class VisualizationGenerator:
         self._create_comparison_bar_chart(ax_main, data, "Execution Time (ms)")
 
         # Add significance markers and winner indicators
-        self._add_significance_markers(ax_main, data, comparisons, "execution_time")
+        self._add_significance_markers(ax_main, data)
 
         # Create simplified legend
         self._create_comparison_legend(ax_main, "execution_time")
 
         # Add statistical summary as figure note
-        self._add_statistical_note(fig, comparisons, "execution_time")
+        self._add_statistical_note(fig, data)
 
         # Save plot
         return self._save_plot(output_path)
@@ -544,13 +529,13 @@ class VisualizationGenerator:
         self._create_comparison_bar_chart(ax_main, data, "Memory Usage (KB)")
 
         # Add significance markers and winner indicators
-        self._add_significance_markers(ax_main, data, comparisons, "memory_usage")
+        self._add_significance_markers(ax_main, data)
 
         # Create simplified legend
         self._create_comparison_legend(ax_main, "memory_usage")
 
         # Add statistical summary as figure note
-        self._add_statistical_note(fig, comparisons, "memory_usage")
+        self._add_statistical_note(fig, data)
 
         # Save plot
         return self._save_plot(output_path)
@@ -2020,42 +2005,42 @@ def _generate_all_visualizations(
 
     generated_files = []
 
+    # (progress label, saved label, file name, chart method)
+    chart_jobs = [
+        (
+            "execution time comparison chart",
+            "execution time chart",
+            "execution_time_comparison.png",
+            viz_generator._create_execution_time_comparison,
+        ),
+        (
+            "memory usage comparison chart",
+            "memory usage chart",
+            "memory_usage_comparison.png",
+            viz_generator._create_memory_usage_comparison,
+        ),
+        (
+            "effect size heatmap",
+            "effect size heatmap",
+            "effect_size_heatmap.png",
+            viz_generator._create_effect_size_heatmap,
+        ),
+        (
+            "distribution and variance analysis",
+            "distribution analysis",
+            "distribution_variance_analysis.png",
+            viz_generator._create_distribution_variance_analysis,
+        ),
+    ]
+
     try:
-        # Generate execution time comparison chart
-        print("📊 Creating execution time comparison chart...")
-        exec_time_path = str(output_dir / "execution_time_comparison.png")
-        generated_exec_time = viz_generator._create_execution_time_comparison(
-            comparison_results, exec_time_path
-        )
-        generated_files.append(generated_exec_time)
-        print(f"  ✅ Saved execution time chart: {generated_exec_time}")
-
-        # Generate memory usage comparison chart
-        print("📊 Creating memory usage comparison chart...")
-        memory_path = str(output_dir / "memory_usage_comparison.png")
-        generated_memory = viz_generator._create_memory_usage_comparison(
-            comparison_results, memory_path
-        )
-        generated_files.append(generated_memory)
-        print(f"  ✅ Saved memory usage chart: {generated_memory}")
-
-        # Generate effect size heatmap
-        print("📊 Creating effect size heatmap...")
-        heatmap_path = str(output_dir / "effect_size_heatmap.png")
-        generated_heatmap = viz_generator._create_effect_size_heatmap(
-            comparison_results, heatmap_path
-        )
-        generated_files.append(generated_heatmap)
-        print(f"  ✅ Saved effect size heatmap: {generated_heatmap}")
-
-        # Generate distribution and variance analysis chart
-        print("📊 Creating distribution and variance analysis...")
-        distribution_path = str(output_dir / "distribution_variance_analysis.png")
-        generated_distribution = viz_generator._create_distribution_variance_analysis(
-            comparison_results, distribution_path
-        )
-        generated_files.append(generated_distribution)
-        print(f"  ✅ Saved distribution analysis: {generated_distribution}")
+        for progress_label, saved_label, filename, create_chart in chart_jobs:
+            print(f"📊 Creating {progress_label}...")
+            generated_chart = create_chart(
+                comparison_results, str(output_dir / filename)
+            )
+            generated_files.append(generated_chart)
+            print(f"  ✅ Saved {saved_label}: {generated_chart}")
 
         # Generate decision summary panel HTML
         print("📊 Creating decision summary panel...")
@@ -139,10 +139,11 @@ class QualityController:
         """Group samples by task, language, and scale combination."""
         task_groups: dict[tuple[str, str, str], list[BenchmarkSample]] = {}
         for sample in all_samples:
-            key = (sample.task, sample.language, sample.scale)
-            if key not in task_groups:
-                task_groups[key] = []
-            task_groups[key].append(sample)
+            # Single hash lookup per sample; the group keys double as the
+            # distinct task/language/scale combinations for later passes
+            task_groups.setdefault(
+                (sample.task, sample.language, sample.scale), []
+            ).append(sample)
         return task_groups
 
     def _process_task_groups(
@@ -153,8 +154,6 @@ class QualityController:
         all_removed_outliers = []
 
         for (task, language, scale), samples in task_groups.items():
-            group_key = self._generate_group_key(task, language, scale)
-
             # Partition samples into successful and failed
             successful_samples, failed_samples = self._partition_samples_by_success(
                 samples
@@ -164,6 +163,7 @@ class QualityController:
 
             # Validate sample counts meet minimum requirements
             if successful_runs < self.min_samples:
+                group_key = self._generate_group_key(task, language, scale)
                 self.cleaning_log.append(
                     f"Warning: {group_key} has only {successful_runs} successful samples "
                     f"(minimum: {self.min_samples})"
@@ -175,6 +175,7 @@ class QualityController:
             all_removed_outliers.extend(outliers)
 
             if outliers:
+                group_key = self._generate_group_key(task, language, scale)
                 self.cleaning_log.append(
                     f"Removed {len(outliers)} outliers from {group_key} "
                     f"({len(outliers) / len(successful_samples) * 100:.1f}% of successful samples)"
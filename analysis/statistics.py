@@ -8,11 +8,13 @@ for engineering-grade statistical comparison between Rust and TinyGo implementat
 import json
 import math
 import sys
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from scipy.stats import t as t_dist
+import numpy as np
 
 from . import common
 from .data_models import (
@@ -36,15 +38,57 @@ COEFFICIENT_VARIATION_THRESHOLD = 1e-9
 DEFAULT_POOLED_STD = 1.0
 FALLBACK_DEGREES_FREEDOM = 1.0
 
+# Upper bound on memoized (n, mean, variance) summaries per engine
+BASIC_STATS_CACHE_SIZE = 2048
+
 # Quartile percentiles
 FIRST_QUARTILE = 0.25
+MEDIAN_QUANTILE = 0.5
 THIRD_QUARTILE = 0.75
+MINIMUM_SAMPLES_FOR_QUARTILES = 4
 
 
 CLEANED_DATASET_PATH = Path("reports/qc/cleaned_dataset.json")
 STATS_PATH = Path("reports/statistics/")
 
 
+@dataclass
+class ComparisonInputs:
+    """Validated Rust and TinyGo metric samples for one task-scale comparison."""
+
+    rust_result: TaskResult
+    tinygo_result: TaskResult
+    rust_exec_times: np.ndarray
+    tinygo_exec_times: np.ndarray
+    rust_memory_usage: np.ndarray
+    tinygo_memory_usage: np.ndarray
+
+
+def _calculate_basic_stats(data: bytes) -> tuple[int, float, float]:
+    """
+    Calculate sample size, mean and variance with NumPy reductions.
+
+    Performance: vectorized C reductions instead of a per-sample Python loop
+    Stability: NumPy's pairwise summation and two-pass variance keep rounding
+    error low for all dataset sizes
+
+    Args:
+        data: Raw float64 bytes of the performance data samples
+
+    Returns:
+        Tuple[int, float, float]: (n, mean, variance)
+    """
+    values = np.frombuffer(data, dtype=np.float64)
+    n = values.size
+    if n == 0:
+        return 0, 0.0, 0.0
+
+    if n == 1:
+        return 1, float(values[0]), 0.0
+
+    return n, float(values.mean()), float(values.var(ddof=1))
+
+
 class StatisticalAnalysis:
     """Statistical analysis engine for benchmark performance comparison"""
 
@@ -58,8 +102,16 @@ class StatisticalAnalysis:
         self.config = stats_config
         self.alpha = self.config.significance_alpha
         self.confidence_level = self.config.confidence_level
+        # Tail probability on each side of the two-sided confidence interval
+        self.tail_probability = (1 - self.confidence_level) / 2
         self.effect_thresholds = self.config.effect_size_thresholds
         self.minimum_detectable_effect = self.config.minimum_detectable_effect
+        # Each entry keeps its key, a full copy of the group's float64 bytes, so
+        # the cache holds at most BASIC_STATS_CACHE_SIZE x 8 bytes x the largest
+        # group size (16 MB for 1000-sample groups) and is freed with the engine
+        self._basic_stats_cache = lru_cache(maxsize=BASIC_STATS_CACHE_SIZE)(
+            _calculate_basic_stats
+        )
 
     def welch_t_test(self, group1: list[float], group2: list[float]) -> TTestResult:
         """
@@ -77,52 +129,92 @@ class StatisticalAnalysis:
             TTestResult: Complete t-test results with significance assessment
 
         Raises:
-            TypeError: If inputs are not lists
+            TypeError: If inputs are not lists or arrays
             ValueError: If data contains invalid values
         """
         self._validate_groups(group1, group2, "welch_t_test")
         # Calculate sample statistics for both groups with caching
-        n1, mean1, var1 = self._get_basic_stats(group1)
-        n2, mean2, var2 = self._get_basic_stats(group2)
-
-        if n1 < MINIMUM_SAMPLES_FOR_TEST or n2 < MINIMUM_SAMPLES_FOR_TEST:
-            # Insufficient data for meaningful t-test
-            return TTestResult(
-                t_statistic=0.0,
-                p_value=1.0,
-                degrees_freedom=1.0,
-                confidence_interval_lower=0.0,
-                confidence_interval_upper=0.0,
-                mean_difference=mean1 - mean2,
-                is_significant=False,
-                alpha=self.alpha,
-            )
+        group_stats = (self._get_basic_stats(group1), self._get_basic_stats(group2))
+        return self._welch_t_tests([group_stats])[0]
 
-        # Calculate Welch's t-statistic
-        t_statistic = self._calculate_welch_t_stats(mean1, mean2, var1, var2, n1, n2)
+    def _welch_t_tests(
+        self,
+        group_stats: list[tuple[tuple[int, float, float], tuple[int, float, float]]],
+    ) -> list[TTestResult]:
+        """
+        Perform Welch's t-tests for many group pairs in one vectorized pass.
 
-        # Calculate Welch-Satterthwaite degrees of freedom
-        degrees_freedom = self._calculate_welch_degrees_freedom(var1, var2, n1, n2)
+        The t-distribution is evaluated once per batch with array arguments instead
+        of once per comparison, removing the per-call SciPy dispatch overhead.
 
-        # Calculate two-tailed p-value
-        p_value = self._calculate_p_value(t_statistic, degrees_freedom)
+        Args:
+            group_stats: ((n1, mean1, var1), (n2, mean2, var2)) for each comparison
 
-        # Determine statistical significance
-        is_significant = p_value < self.alpha
+        Returns:
+            List[TTestResult]: t-test results in the same order as group_stats
+        """
+        if not group_stats:
+            return []
 
-        # Calculate confidence interval for mean difference
-        ci_lower, ci_upper = self._confidence_interval(group1, group2)
+        # scipy.stats dominates import time, so it is loaded on first use to
+        # keep importing this module cheap
+        from scipy.stats import ttest_ind_from_stats
 
-        return TTestResult(
-            t_statistic=t_statistic,
-            p_value=p_value,
-            degrees_freedom=degrees_freedom,
-            confidence_interval_lower=ci_lower,
-            confidence_interval_upper=ci_upper,
-            mean_difference=mean1 - mean2,
-            is_significant=is_significant,
-            alpha=self.alpha,
+        stats = np.array(
+            [(*stats1, *stats2) for stats1, stats2 in group_stats], dtype=np.float64
         )
+        n1, mean1, var1, n2, mean2, var2 = stats.T
+        mean_difference = mean1 - mean2
+
+        # Rows with insufficient data produce NaN/inf here; they are replaced below
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Standard error of the difference in means, shared by t and the CI
+            standard_error = np.sqrt(var1 / n1 + var2 / n2)
+            t_statistic, p_value = ttest_ind_from_stats(
+                mean1, np.sqrt(var1), n1, mean2, np.sqrt(var2), n2, equal_var=False
+            )
+            # Zero spread in both groups means no testable difference
+            no_spread = standard_error == 0
+            t_statistic = np.where(no_spread, 0.0, t_statistic)
+            p_value = np.where(no_spread, 1.0, p_value)
+
+            degrees_freedom = self._calculate_welch_degrees_freedom(var1, var2, n1, n2)
+            ci_lower, ci_upper = self._confidence_interval(
+                mean_difference, standard_error, degrees_freedom
+            )
+
+        results = []
+        for i in range(len(group_stats)):
+            if n1[i] < MINIMUM_SAMPLES_FOR_TEST or n2[i] < MINIMUM_SAMPLES_FOR_TEST:
+                # Insufficient data for meaningful t-test
+                results.append(
+                    TTestResult(
+                        t_statistic=0.0,
+                        p_value=1.0,
+                        degrees_freedom=1.0,
+                        confidence_interval_lower=0.0,
+                        confidence_interval_upper=0.0,
+                        mean_difference=float(mean_difference[i]),
+                        is_significant=False,
+                        alpha=self.alpha,
+                    )
+                )
+                continue
+
+            results.append(
+                TTestResult(
+                    t_statistic=float(t_statistic[i]),
+                    p_value=float(p_value[i]),
+                    degrees_freedom=float(degrees_freedom[i]),
+                    confidence_interval_lower=float(ci_lower[i]),
+                    confidence_interval_upper=float(ci_upper[i]),
+                    mean_difference=float(mean_difference[i]),
+                    is_significant=bool(p_value[i] < self.alpha),
+                    alpha=self.alpha,
+                )
+            )
+
+        return results
 
     def cohens_d(self, group1: list[float], group2: list[float]) -> EffectSizeResult:
         """
@@ -145,56 +237,90 @@ class StatisticalAnalysis:
             including assessment against minimum detectable effect threshold
 
         Raises:
-            TypeError: If inputs are not lists
+            TypeError: If inputs are not lists or arrays
             ValueError: If data contains invalid values
         """
         self._validate_groups(group1, group2, "cohens_d")
-        # Calculate sample statistics for both groups with caching
-        n1, mean1, var1 = self._get_basic_stats(group1)
-        n2, mean2, var2 = self._get_basic_stats(group2)
-
-        if n1 < MINIMUM_SAMPLES_FOR_TEST or n2 < MINIMUM_SAMPLES_FOR_TEST:
-            # Insufficient data for meaningful effect size calculation
-            return EffectSizeResult(
-                cohens_d=0.0,
-                effect_size=EffectSize.NEGLIGIBLE,
-                pooled_std=1.0,
-                magnitude=0.0,
-                interpretation="Insufficient data for effect size calculation",
-                meets_minimum_detectable_effect=False,
-            )
+        group_stats = (self._get_basic_stats(group1), self._get_basic_stats(group2))
+        return self._effect_sizes([group_stats])[0]
 
-        # Calculate standard deviations
-        std1 = math.sqrt(var1)
-        std2 = math.sqrt(var2)
+    def _effect_sizes(
+        self,
+        group_stats: list[tuple[tuple[int, float, float], tuple[int, float, float]]],
+    ) -> list[EffectSizeResult]:
+        """
+        Calculate Cohen's d for many group pairs in one vectorized pass.
 
-        # Calculate pooled standard deviation
-        pooled_std = self._calculate_pooled_std(std1, std2, n1, n2)
+        Works from the (n, mean, variance) summaries already used by the t-tests,
+        so pooled standard deviations, d values and magnitude classes for the
+        whole batch are a handful of array operations.
 
-        # Calculate Cohen's d value
-        cohens_d_value = self._calculate_cohens_d_value(mean1, mean2, pooled_std)
+        Args:
+            group_stats: ((n1, mean1, var1), (n2, mean2, var2)) for each comparison
 
-        # Classify effect size magnitude
-        effect_size = self._classify_effect_size(cohens_d_value)
+        Returns:
+            List[EffectSizeResult]: Effect size results in the same order as group_stats
+        """
+        if not group_stats:
+            return []
 
-        # Generate interpretation with MDE assessment
-        abs_d = abs(cohens_d_value)
-        meets_mde = abs_d >= self.minimum_detectable_effect
-        interpretation = self._generate_effect_size_interpretation(
-            cohens_d_value, abs_d, meets_mde
+        stats = np.array(
+            [(*stats1, *stats2) for stats1, stats2 in group_stats], dtype=np.float64
         )
+        n1, mean1, var1, n2, mean2, var2 = stats.T
 
-        return EffectSizeResult(
-            cohens_d=cohens_d_value,
-            effect_size=effect_size,
-            pooled_std=pooled_std,
-            magnitude=abs_d,
-            interpretation=interpretation,
-            meets_minimum_detectable_effect=meets_mde,
-        )
+        # Rows with insufficient data produce NaN/inf here; they are replaced below
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Calculate pooled standard deviation directly from the variances
+            pooled_std = self._calculate_pooled_std(var1, var2, n1, n2)
+
+            # Calculate Cohen's d value
+            cohens_d_value = self._calculate_cohens_d_value(mean1, mean2, pooled_std)
+
+        # Assess effect size magnitude against the MDE
+        abs_d = np.abs(cohens_d_value)
+        meets_mde = abs_d >= self.minimum_detectable_effect
+
+        results = []
+        for i in range(len(group_stats)):
+            if n1[i] < MINIMUM_SAMPLES_FOR_TEST or n2[i] < MINIMUM_SAMPLES_FOR_TEST:
+                # Insufficient data for meaningful effect size calculation
+                results.append(
+                    EffectSizeResult(
+                        cohens_d=0.0,
+                        effect_size=EffectSize.NEGLIGIBLE,
+                        pooled_std=1.0,
+                        magnitude=0.0,
+                        interpretation="Insufficient data for effect size calculation",
+                        meets_minimum_detectable_effect=False,
+                    )
+                )
+                continue
+
+            # Generate interpretation with MDE assessment
+            d_value = float(cohens_d_value[i])
+            magnitude = float(abs_d[i])
+            meets = bool(meets_mde[i])
+            results.append(
+                EffectSizeResult(
+                    cohens_d=d_value,
+                    effect_size=self._classify_effect_size(magnitude),
+                    pooled_std=float(pooled_std[i]),
+                    magnitude=magnitude,
+                    interpretation=self._generate_effect_size_interpretation(
+                        d_value, magnitude, meets
+                    ),
+                    meets_minimum_detectable_effect=meets,
+                )
+            )
+
+        return results
 
     def _validate_groups(
-        self, group1: list[float], group2: list[float], method_name: str
+        self,
+        group1: list[float] | np.ndarray,
+        group2: list[float] | np.ndarray,
+        method_name: str,
     ) -> None:
         """Validate input groups for statistical analysis.
 
@@ -204,38 +330,50 @@ class StatisticalAnalysis:
             method_name: Name of calling method for error context
 
         Raises:
-            TypeError: If inputs are not lists
+            TypeError: If inputs are not lists or arrays
             ValueError: If data contains non-numeric values or insufficient samples
         """
-        if not isinstance(group1, list) or not isinstance(group2, list):
-            raise TypeError(f"{method_name}: Input groups must be lists")
+        if not isinstance(group1, list | np.ndarray) or not isinstance(
+            group2, list | np.ndarray
+        ):
+            raise TypeError(f"{method_name}: Input groups must be lists or arrays")
 
-        if not group1 and not group2:
+        if len(group1) == 0 and len(group2) == 0:
             raise ValueError(f"{method_name}: Both groups cannot be empty")
 
-        # Check for numeric values
-        for i, value in enumerate(group1):
-            if (
-                not isinstance(value, int | float)
-                or math.isnan(value)
-                or math.isinf(value)
-            ):
-                raise ValueError(
-                    f"{method_name}: group1[{i}] contains invalid numeric value: {value}"
+        # Check for numeric values and negative values (performance times should
+        # be positive), one vectorized pass per group
+        has_negative = False
+        for label, group in (("group1", group1), ("group2", group2)):
+            values = np.asarray(group) if len(group) else np.empty(0)
+            if values.ndim != 1 or values.dtype.kind not in "biuf":
+                # Mixed or non-numeric content: locate the offending element
+                invalid_index = next(
+                    (
+                        i
+                        for i, value in enumerate(group)
+                        if not isinstance(value, int | float)
+                        or math.isnan(value)
+                        or math.isinf(value)
+                    ),
+                    None,
                 )
+                if invalid_index is None:
+                    has_negative = has_negative or any(x < 0 for x in group)
+                    continue
+            else:
+                is_finite = np.isfinite(values)
+                if is_finite.all():
+                    has_negative = has_negative or bool((values < 0).any())
+                    continue
+                invalid_index = int(np.argmin(is_finite))
 
-        for i, value in enumerate(group2):
-            if (
-                not isinstance(value, int | float)
-                or math.isnan(value)
-                or math.isinf(value)
-            ):
-                raise ValueError(
-                    f"{method_name}: group2[{i}] contains invalid numeric value: {value}"
-                )
+            raise ValueError(
+                f"{method_name}: {label}[{invalid_index}] contains invalid numeric "
+                f"value: {group[invalid_index]}"
+            )
 
-        # Check for negative values (performance times should be positive)
-        if any(x < 0 for x in group1) or any(x < 0 for x in group2):
+        if has_negative:
             raise ValueError(
                 f"{method_name}: Performance data should not contain negative values"
             )
@@ -255,91 +393,19 @@ class StatisticalAnalysis:
             coefficient_variation=0.0,
         )
 
-    def _calculate_median_from_sorted(self, sorted_data: list[float]) -> float:
-        """
-        Calculate median from pre-sorted data.
-
-        Args:
-            sorted_data: Pre-sorted performance data
-
-        Returns:
-            float: Median value
-        """
-        n = len(sorted_data)
-        if n % 2 == 0:
-            return (sorted_data[n // 2 - 1] + sorted_data[n // 2]) / 2
-        else:
-            return sorted_data[n // 2]
-
-    def _calculate_basic_stats_welford(
-        self, data: list[float]
-    ) -> tuple[int, float, float]:
-        """
-        Calculate mean and variance using Welford's online algorithm.
-
-        Performance: O(n) single pass vs O(2n) current approach
-        Stability: Numerically stable for all dataset sizes
-
-        Args:
-            data: Performance data samples
-
-        Returns:
-            Tuple[int, float, float]: (n, mean, variance)
-        """
-        if not data:
-            return 0, 0.0, 0.0
-
-        n = len(data)
-        if n == 1:
-            return 1, data[0], 0.0
-
-        mean = 0.0
-        m2 = 0.0  # Sum of squares of differences from current mean
-
-        for i, x in enumerate(data, 1):
-            delta = x - mean
-            mean += delta / i  # Running mean update
-            delta2 = x - mean
-            m2 += delta * delta2  # Running variance accumulator
-
-        variance = m2 / (n - 1) if n > 1 else 0.0
-        return n, mean, variance
-
-    def _calculate_welch_t_stats(
-        self, mean1: float, mean2: float, var1: float, var2: float, n1: int, n2: int
-    ) -> float:
-        """
-        Calculate Welch's t-statistic for unequal variances.
-
-        Args:
-            mean1, mean2: Sample means
-            var1, var2: Sample variances
-            n1, n2: Sample sizes
-
-        Returns:
-            float: t-statistic value
-        """
-        standard_error = math.sqrt(var1 / n1 + var2 / n2)
-        if standard_error == 0:
-            return 0.0
-        return (mean1 - mean2) / standard_error
-
     def _calculate_welch_degrees_freedom(
-        self, var1: float, var2: float, n1: int, n2: int
-    ) -> float:
+        self, var1: np.ndarray, var2: np.ndarray, n1: np.ndarray, n2: np.ndarray
+    ) -> np.ndarray:
         """
-        Calculate Welch-Satterthwaite degrees of freedom.
+        Calculate Welch-Satterthwaite degrees of freedom element-wise.
 
         Args:
             var1, var2: Sample variances
             n1, n2: Sample sizes
 
         Returns:
-            float: Degrees of freedom
+            np.ndarray: Degrees of freedom (fallback where undefined)
         """
-        if n1 <= 1 or n2 <= 1:
-            return FALLBACK_DEGREES_FREEDOM
-
         s1_squared_over_n1 = var1 / n1
         s2_squared_over_n2 = var2 / n2
 
@@ -348,59 +414,50 @@ class StatisticalAnalysis:
             s2_squared_over_n2**2
         ) / (n2 - 1)
 
-        if denominator == 0:
-            return FALLBACK_DEGREES_FREEDOM
-
-        return numerator / denominator
+        is_defined = (n1 > 1) & (n2 > 1) & (denominator != 0)
+        return np.divide(
+            numerator,
+            denominator,
+            out=np.full_like(numerator, FALLBACK_DEGREES_FREEDOM),
+            where=is_defined,
+        )
 
-    def _calculate_quartiles(self, sorted_data: list[float]) -> tuple[float, float]:
+    def _calculate_order_statistics(
+        self, values: np.ndarray
+    ) -> tuple[float, float, float, float, float]:
         """
-        Calculate first and third quartiles efficiently.
+        Calculate minimum, quartiles and maximum with a single partial sort.
+
+        One np.partition call places the extremes and the neighbours of every
+        quartile position in O(n), instead of an O(n log n) full sort; quartiles
+        are then linearly interpolated between those neighbours.
 
         Args:
-            sorted_data: Sorted performance data
+            values: Performance data samples (non-empty)
 
         Returns:
-            Tuple[float, float]: (Q1, Q3) values
+            Tuple[float, float, float, float, float]: (min, Q1, median, Q3, max)
         """
-        n = len(sorted_data)
-
-        if n < 4:
-            # For small datasets, use median as approximation
-            median_val = (
-                sorted_data[n // 2]
-                if n % 2 == 1
-                else (sorted_data[n // 2 - 1] + sorted_data[n // 2]) / 2
-            )
-            return median_val, median_val
-
-        # Calculate quartile positions using linear interpolation
-        q1_pos = FIRST_QUARTILE * (n - 1)
-        q3_pos = THIRD_QUARTILE * (n - 1)
-
-        # Q1 calculation
-        q1_lower = int(q1_pos)
-        q1_frac = q1_pos - q1_lower
-
-        if q1_lower + 1 < n:
-            q1 = sorted_data[q1_lower] + q1_frac * (
-                sorted_data[q1_lower + 1] - sorted_data[q1_lower]
-            )
-        else:
-            q1 = sorted_data[q1_lower]
+        last_index = len(values) - 1
+        positions = last_index * np.array(
+            (FIRST_QUARTILE, MEDIAN_QUANTILE, THIRD_QUARTILE)
+        )
+        lower = np.floor(positions).astype(np.intp)
+        upper = np.minimum(lower + 1, last_index)
 
-        # Q3 calculation
-        q3_lower = int(q3_pos)
-        q3_frac = q3_pos - q3_lower
+        partitioned = np.partition(
+            values, np.unique(np.concatenate(([0, last_index], lower, upper)))
+        )
+        q1, median, q3 = partitioned[lower] + (
+            partitioned[upper] - partitioned[lower]
+        ) * (positions - lower)
+        min_val, max_val = float(partitioned[0]), float(partitioned[last_index])
 
-        if q3_lower + 1 < n:
-            q3 = sorted_data[q3_lower] + q3_frac * (
-                sorted_data[q3_lower + 1] - sorted_data[q3_lower]
-            )
-        else:
-            q3 = sorted_data[q3_lower]
+        if len(values) < MINIMUM_SAMPLES_FOR_QUARTILES:
+            # For small datasets, use median as approximation
+            return min_val, float(median), float(median), float(median), max_val
 
-        return q1, q3
+        return min_val, float(q1), float(median), float(q3), max_val
 
     def _generate_effect_size_interpretation(
         self, cohens_d_value: float, abs_d: float, meets_mde: bool
@@ -446,9 +503,15 @@ class StatisticalAnalysis:
 
         return base_interpretation + mde_interpretation + practical_assessment
 
-    def _get_basic_stats(self, data: list[float]) -> tuple[int, float, float]:
+    def _get_basic_stats(
+        self, data: list[float] | np.ndarray
+    ) -> tuple[int, float, float]:
         """
-        Get basic statistics using Welford's algorithm for numerical stability.
+        Get basic statistics (n, mean, variance) for a sample group.
+
+        Results are memoized per engine by sample content, so the t-test, effect
+        size and descriptive statistics for the same group share a single
+        computation.
 
         Args:
             data: Performance data samples
@@ -456,62 +519,47 @@ class StatisticalAnalysis:
         Returns:
             Tuple[int, float, float]: (n, mean, variance)
         """
-        return self._calculate_basic_stats_welford(data)
-
-    def _calculate_p_value(self, t_stat: float, df: float) -> float:
-        """
-        Calculate accurate two-tailed p-value for t-statistic using t-distribution.
-
-        Args:
-            t_stat: t-statistic value
-            df: Degrees of freedom
-
-        Returns:
-            float: Two-tailed p-value
-        """
-        # Use scipy for accurate p-value calculation
-        abs_t = abs(t_stat)
-        # Two-tailed p-value: P(|T| > |t|) = 2 * P(T > |t|) = 2 * (1 - CDF(|t|))
-        p_value = 2 * (1 - t_dist.cdf(abs_t, df))
-        return float(p_value)  # Ensure return type is float
+        # Raw float64 bytes make a compact key that is hashed in C, without
+        # building a tuple of Python floats
+        return self._basic_stats_cache(np.asarray(data, dtype=np.float64).tobytes())
 
     def _calculate_pooled_std(
-        self, std1: float, std2: float, n1: int, n2: int
-    ) -> float:
+        self, var1: np.ndarray, var2: np.ndarray, n1: np.ndarray, n2: np.ndarray
+    ) -> np.ndarray:
         """
-        Calculate pooled standard deviation for Cohen's d.
+        Calculate pooled standard deviations for Cohen's d element-wise.
 
         Args:
-            std1, std2: Sample standard deviations
+            var1, var2: Sample variances
             n1, n2: Sample sizes
 
         Returns:
-            float: Pooled standard deviation
+            np.ndarray: Pooled standard deviations (default where undefined)
         """
-        if n1 <= 1 and n2 <= 1:
-            return DEFAULT_POOLED_STD
-
-        var1 = std1**2
-        var2 = std2**2
         pooled_variance = ((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2)
-        return math.sqrt(max(0, pooled_variance))  # Ensure non-negative
+        pooled_std = np.sqrt(np.maximum(0, pooled_variance))  # Ensure non-negative
+        return np.where((n1 <= 1) & (n2 <= 1), DEFAULT_POOLED_STD, pooled_std)
 
     def _calculate_cohens_d_value(
-        self, mean1: float, mean2: float, pooled_std: float
-    ) -> float:
+        self, mean1: np.ndarray, mean2: np.ndarray, pooled_std: np.ndarray
+    ) -> np.ndarray:
         """
-        Calculate Cohen's d effect size value.
+        Calculate Cohen's d effect size values element-wise.
 
         Args:
             mean1, mean2: Sample means
-            pooled_std: Pooled standard deviation
+            pooled_std: Pooled standard deviations
 
         Returns:
-            float: Cohen's d value
+            np.ndarray: Cohen's d values (0 where the pooled deviation is zero)
         """
-        if pooled_std == 0:
-            return 0.0
-        return (mean1 - mean2) / pooled_std
+        mean_difference = mean1 - mean2
+        return np.divide(
+            mean_difference,
+            pooled_std,
+            out=np.zeros_like(mean_difference),
+            where=pooled_std != 0,
+        )
 
     def _classify_effect_size(self, cohen_d: float) -> EffectSize:
         """
@@ -536,46 +584,33 @@ class StatisticalAnalysis:
             return EffectSize.NEGLIGIBLE
 
     def _confidence_interval(
-        self, group1: list[float], group2: list[float]
-    ) -> tuple[float, float]:
+        self,
+        mean_difference: np.ndarray,
+        standard_error: np.ndarray,
+        degrees_freedom: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
-        Calculate confidence interval for the difference in means using accurate t-distribution.
+        Calculate confidence intervals for the difference in means using accurate t-distribution.
 
         Args:
-            group1: Performance data for first group
-            group2: Performance data for second group
+            mean_difference: Differences in sample means
+            standard_error: Standard errors of the mean differences
+            degrees_freedom: Welch-Satterthwaite degrees of freedom
 
         Returns:
-            Tuple[float, float]: (lower_bound, upper_bound) of confidence interval
+            Tuple[np.ndarray, np.ndarray]: (lower_bounds, upper_bounds) of confidence intervals
         """
-        # Calculate sample statistics for both groups with caching
-        n1, mean1, var1 = self._get_basic_stats(group1)
-        n2, mean2, var2 = self._get_basic_stats(group2)
-
-        if n1 < MINIMUM_SAMPLES_FOR_TEST or n2 < MINIMUM_SAMPLES_FOR_TEST:
-            # Insufficient data for confidence interval
-            mean_diff = mean1 - mean2
-            return (mean_diff, mean_diff)
+        from scipy.special import stdtrit
 
-        # Calculate standard error of the difference in means
-        standard_error = math.sqrt(var1 / n1 + var2 / n2)
-
-        # Calculate degrees of freedom
-        degrees_freedom = self._calculate_welch_degrees_freedom(var1, var2, n1, n2)
-
-        # Calculate critical t-value using scipy
-        alpha = 1 - self.confidence_level
-        critical_t = float(t_dist.ppf(1 - alpha / 2, degrees_freedom))
+        # Calculate critical t-values for the whole batch in one ufunc call. The
+        # inverse survival function (negated lower-tail quantile) avoids the
+        # precision lost by forming 1 - alpha/2
+        critical_t = -stdtrit(degrees_freedom, self.tail_probability)
 
         # Calculate margin of error
         margin_of_error = critical_t * standard_error
 
-        # Calculate mean difference and confidence interval bounds
-        mean_difference = mean1 - mean2
-        lower_bound = mean_difference - margin_of_error
-        upper_bound = mean_difference + margin_of_error
-
-        return (lower_bound, upper_bound)
+        return (mean_difference - margin_of_error, mean_difference + margin_of_error)
 
     def generate_task_comparison(
         self, rust_result: TaskResult, tinygo_result: TaskResult
@@ -597,17 +632,134 @@ class StatisticalAnalysis:
             TypeError: If inputs are not TaskResult objects
             ValueError: If task results are incompatible for comparison
         """
-        # Validate inputs
+        comparison_inputs = self._prepare_task_comparison(rust_result, tinygo_result)
+        return self._complete_task_comparisons([comparison_inputs])[0]
+
+    def _prepare_task_comparison(
+        self, rust_result: TaskResult, tinygo_result: TaskResult
+    ) -> ComparisonInputs:
+        """
+        Validate a Rust/TinyGo pair and extract the metric samples to compare.
+
+        Args:
+            rust_result: Rust implementation results
+            tinygo_result: TinyGo implementation results
+
+        Returns:
+            ComparisonInputs: Validated per-metric samples for both languages
+
+        Raises:
+            TypeError: If inputs are not TaskResult objects
+            ValueError: If task results or their samples are invalid for comparison
+        """
         self._validate_task_results(rust_result, tinygo_result)
 
-        # Extract and analyze performance data
-        rust_performance, tinygo_performance = self._extract_performance_data(
-            rust_result, tinygo_result
+        rust_exec_times, rust_memory_usage = self._extract_metrics_from_samples(
+            rust_result.samples
+        )
+        tinygo_exec_times, tinygo_memory_usage = self._extract_metrics_from_samples(
+            tinygo_result.samples
         )
 
+        self._validate_groups(
+            rust_exec_times, tinygo_exec_times, "generate_task_comparison"
+        )
+        self._validate_groups(
+            rust_memory_usage, tinygo_memory_usage, "generate_task_comparison"
+        )
+
+        return ComparisonInputs(
+            rust_result=rust_result,
+            tinygo_result=tinygo_result,
+            rust_exec_times=rust_exec_times,
+            tinygo_exec_times=tinygo_exec_times,
+            rust_memory_usage=rust_memory_usage,
+            tinygo_memory_usage=tinygo_memory_usage,
+        )
+
+    def _complete_task_comparisons(
+        self,
+        comparison_inputs: list[ComparisonInputs],
+    ) -> list[ComparisonResult]:
+        """
+        Build ComparisonResults for prepared inputs with batched t-tests.
+
+        Each group's (n, mean, variance) summary is computed once and feeds both
+        the t-test and the effect size of its metric.
+
+        Args:
+            comparison_inputs: Validated inputs from _prepare_task_comparison
+
+        Returns:
+            List[ComparisonResult]: Comparison results in input order
+        """
+        # One batch holds the execution time and memory usage t-tests of every pair
+        group_stats = []
+        for inputs in comparison_inputs:
+            group_stats.append(
+                (
+                    self._get_basic_stats(inputs.rust_exec_times),
+                    self._get_basic_stats(inputs.tinygo_exec_times),
+                )
+            )
+            group_stats.append(
+                (
+                    self._get_basic_stats(inputs.rust_memory_usage),
+                    self._get_basic_stats(inputs.tinygo_memory_usage),
+                )
+            )
+        metric_analyses = list(
+            zip(
+                self._welch_t_tests(group_stats),
+                self._effect_sizes(group_stats),
+                strict=True,
+            )
+        )
+        exec_analyses = metric_analyses[0::2]
+        memory_analyses = metric_analyses[1::2]
+
+        return list(
+            map(
+                self._build_comparison_result,
+                comparison_inputs,
+                exec_analyses,
+                memory_analyses,
+            )
+        )
+
+    def _build_comparison_result(
+        self,
+        inputs: ComparisonInputs,
+        exec_analysis: tuple[TTestResult, EffectSizeResult],
+        memory_analysis: tuple[TTestResult, EffectSizeResult],
+    ) -> ComparisonResult:
+        """
+        Assemble the ComparisonResult for one pair from its precomputed tests.
+
+        Args:
+            inputs: Validated inputs from _prepare_task_comparison
+            exec_analysis: Welch's t-test and Cohen's d for execution time
+            memory_analysis: Welch's t-test and Cohen's d for memory usage
+
+        Returns:
+            ComparisonResult: Comprehensive multi-metric statistical comparison
+        """
+        # Descriptive statistics are computed once per group and shared by the
+        # performance summaries and the metric comparisons
+        rust_performance, tinygo_performance = self._extract_performance_data(inputs)
+
         # Perform statistical comparisons
-        execution_time_comparison, memory_usage_comparison = (
-            self._perform_metric_comparisons(rust_result, tinygo_result)
+        execution_time_comparison = self._create_metric_comparison(
+            MetricType.EXECUTION_TIME,
+            rust_performance.execution_time,
+            tinygo_performance.execution_time,
+            *exec_analysis,
+        )
+        memory_usage_comparison = self._create_metric_comparison(
+            MetricType.MEMORY_USAGE,
+            rust_performance.memory_usage,
+            tinygo_performance.memory_usage,
+            *memory_analysis,
         )
 
         # Generate overall confidence assessment
@@ -616,8 +768,8 @@ class StatisticalAnalysis:
         )
 
         return ComparisonResult(
-            task=rust_result.task,
-            scale=rust_result.scale,
+            task=inputs.rust_result.task,
+            scale=inputs.rust_result.scale,
             rust_performance=rust_performance,
             tinygo_performance=tinygo_performance,
             execution_time_comparison=execution_time_comparison,
@@ -655,107 +807,67 @@ class StatisticalAnalysis:
             )
 
     def _extract_performance_data(
-        self, rust_result: TaskResult, tinygo_result: TaskResult
+        self, inputs: ComparisonInputs
     ) -> tuple[PerformanceStatistics, PerformanceStatistics]:
         """
-        Extract and compute performance statistics for both languages.
+        Compute performance statistics for both languages.
 
-        Optimized single-pass extraction of all performance metrics.
+        Works on the metric samples already extracted by _prepare_task_comparison,
+        so the benchmark samples are not walked again.
 
         Args:
-            rust_result: Rust implementation results
-            tinygo_result: TinyGo implementation results
+            inputs: Validated inputs from _prepare_task_comparison
 
         Returns:
             Tuple of PerformanceStatistics for (Rust, TinyGo)
         """
-        # Single-pass extraction for Rust
-        rust_exec_times, rust_memory_usage = self._extract_metrics_from_samples(
-            rust_result.samples
-        )
-        rust_exec_stats = self._calculate_complete_stats(rust_exec_times)
-        rust_memory_stats = self._calculate_complete_stats(rust_memory_usage)
-
-        # Single-pass extraction for TinyGo
-        tinygo_exec_times, tinygo_memory_usage = self._extract_metrics_from_samples(
-            tinygo_result.samples
-        )
-        tinygo_exec_stats = self._calculate_complete_stats(tinygo_exec_times)
-        tinygo_memory_stats = self._calculate_complete_stats(tinygo_memory_usage)
-
-        # Create PerformanceStatistics containers
         rust_performance = PerformanceStatistics(
-            execution_time=rust_exec_stats,
-            memory_usage=rust_memory_stats,
-            success_rate=rust_result.success_rate,
+            execution_time=self._calculate_complete_stats(inputs.rust_exec_times),
+            memory_usage=self._calculate_complete_stats(inputs.rust_memory_usage),
+            success_rate=inputs.rust_result.success_rate,
         )
 
         tinygo_performance = PerformanceStatistics(
-            execution_time=tinygo_exec_stats,
-            memory_usage=tinygo_memory_stats,
-            success_rate=tinygo_result.success_rate,
+            execution_time=self._calculate_complete_stats(inputs.tinygo_exec_times),
+            memory_usage=self._calculate_complete_stats(inputs.tinygo_memory_usage),
+            success_rate=inputs.tinygo_result.success_rate,
         )
 
         return rust_performance, tinygo_performance
 
     def _extract_metrics_from_samples(
         self, samples: list[BenchmarkSample]
-    ) -> tuple[list[float], list[float]]:
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
         Single-pass extraction of execution time and memory usage from samples.
 
-        Performance optimization: Extract both metrics in one iteration.
+        Performance optimization: Extract both metrics in one iteration into
+        contiguous float64 arrays (structure of arrays), so every downstream
+        statistic runs as a NumPy operation without per-sample attribute lookups.
 
         Args:
             samples: List of benchmark samples
 
         Returns:
-            Tuple of (execution_times, memory_usage) lists
+            Tuple of (execution_times, memory_usage) arrays
         """
-        exec_times = []
-        memory_usage = []
+        metrics = np.array(
+            [
+                (sample.executionTime, sample.memoryUsed, sample.wasmMemoryBytes)
+                for sample in samples
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 3)
 
-        for sample in samples:
-            exec_times.append(sample.executionTime)
-            # Convert memory usage to KB (from bytes)
-            memory_usage.append((sample.memoryUsed + sample.wasmMemoryBytes) / 1024)
+        exec_times = np.ascontiguousarray(metrics[:, 0])
+        # Convert memory usage to KB (from bytes)
+        memory_usage = (metrics[:, 1] + metrics[:, 2]) / 1024
 
         return exec_times, memory_usage
 
-    def _perform_metric_comparisons(
-        self, rust_result: TaskResult, tinygo_result: TaskResult
-    ) -> tuple[MetricComparison, MetricComparison]:
-        """
-        Perform statistical comparisons for all performance metrics.
-
-        Args:
-            rust_result: Rust implementation results
-            tinygo_result: TinyGo implementation results
-
-        Returns:
-            Tuple of MetricComparison for (execution_time, memory_usage)
-        """
-        # Extract metrics for statistical comparison
-        rust_exec_times, rust_memory_usage = self._extract_metrics_from_samples(
-            rust_result.samples
-        )
-        tinygo_exec_times, tinygo_memory_usage = self._extract_metrics_from_samples(
-            tinygo_result.samples
-        )
-
-        # Execution time statistical analysis
-        exec_time_comparison = self._create_metric_comparison(
-            MetricType.EXECUTION_TIME, rust_exec_times, tinygo_exec_times
-        )
-
-        # Memory usage statistical analysis
-        memory_usage_comparison = self._create_metric_comparison(
-            MetricType.MEMORY_USAGE, rust_memory_usage, tinygo_memory_usage
-        )
-
-        return exec_time_comparison, memory_usage_comparison
-
-    def _calculate_complete_stats(self, data: list[float]) -> StatisticalResult:
+    def _calculate_complete_stats(
+        self, data: list[float] | np.ndarray
+    ) -> StatisticalResult:
         """
         Calculate complete descriptive statistics using in-memory processing.
 
@@ -765,7 +877,7 @@ class StatisticalAnalysis:
         Returns:
             StatisticalResult: Complete statistical measures
         """
-        if not data:
+        if len(data) == 0:
             return self._empty_statistical_result()
 
         return self._calculate_complete_stats_memory(data)
@@ -893,14 +1005,16 @@ class StatisticalAnalysis:
             },
         }
 
-    def _calculate_complete_stats_memory(self, data: list[float]) -> StatisticalResult:
+    def _calculate_complete_stats_memory(
+        self, data: list[float] | np.ndarray
+    ) -> StatisticalResult:
         """
         Calculate complete descriptive statistics with optimized in-memory processing.
 
         Performance optimizations:
-        - Single pass for basic statistics using Welford's algorithm
-        - Single sort for all percentile calculations
-        - Reuse sorted data for min/max operations
+        - Vectorized NumPy reductions for mean and variance
+        - Single conversion and partial sort of the samples, shared by min/max and
+          all percentile calculations
 
         Args:
             data: Performance data samples
@@ -908,20 +1022,16 @@ class StatisticalAnalysis:
         Returns:
             StatisticalResult: Complete statistical measures
         """
-        # Single pass for basic statistics using Welford's algorithm
-        n, mean, variance = self._calculate_basic_stats_welford(data)
+        # Basic statistics shared with the t-test and effect size calculations
+        n, mean, variance = self._get_basic_stats(data)
         std = math.sqrt(variance)
         coefficient_variation = (
             std / mean if abs(mean) > COEFFICIENT_VARIATION_THRESHOLD else 0.0
         )
 
-        # Single sort for all percentile calculations
-        sorted_data = sorted(data)
-        min_val, max_val = sorted_data[0], sorted_data[-1]  # O(1) vs separate min/max
-
-        # Efficient percentile calculations from sorted data
-        median = self._calculate_median_from_sorted(sorted_data)
-        q1, q3 = self._calculate_quartiles(sorted_data)
+        min_val, q1, median, q3, max_val = self._calculate_order_statistics(
+            np.asarray(data, dtype=np.float64)
+        )
 
         return StatisticalResult(
             count=n,
@@ -937,27 +1047,26 @@ class StatisticalAnalysis:
         )
 
     def _create_metric_comparison(
-        self, metric_type: MetricType, rust_data: list[float], tinygo_data: list[float]
+        self,
+        metric_type: MetricType,
+        rust_stats: StatisticalResult,
+        tinygo_stats: StatisticalResult,
+        t_test_result: TTestResult,
+        effect_size_result: EffectSizeResult,
     ) -> MetricComparison:
         """
         Create MetricComparison with complete statistical analysis.
 
         Args:
             metric_type: Type of performance metric being compared
-            rust_data: Rust performance data
-            tinygo_data: TinyGo performance data
+            rust_stats: Descriptive statistics of the Rust data
+            tinygo_stats: Descriptive statistics of the TinyGo data
+            t_test_result: Precomputed Welch's t-test for this metric
+            effect_size_result: Precomputed Cohen's d for this metric
 
         Returns:
             MetricComparison with t-test and effect size analysis
         """
-        # Statistical analysis
-        t_test_result = self.welch_t_test(rust_data, tinygo_data)
-        effect_size_result = self.cohens_d(rust_data, tinygo_data)
-
-        # Calculate statistics for both datasets
-        rust_stats = self._calculate_complete_stats(rust_data)
-        tinygo_stats = self._calculate_complete_stats(tinygo_data)
-
         return MetricComparison(
             metric_type=metric_type,
             rust_stats=rust_stats,
@@ -979,57 +1088,33 @@ class StatisticalAnalysis:
         Returns:
             str: Overall confidence level assessment
         """
-        # Check for strong evidence in either metric
-        exec_strong = (
-            exec_comparison.is_significant and exec_comparison.practical_significance
-        )
-        memory_strong = (
-            memory_comparison.is_significant
-            and memory_comparison.practical_significance
-        )
+        # Read each comparison's significance properties once
+        exec_significant = exec_comparison.is_significant
+        exec_practical = exec_comparison.practical_significance
+        memory_significant = memory_comparison.is_significant
+        memory_practical = memory_comparison.practical_significance
 
-        # Check for statistical significance only
-        exec_stat_only = (
-            exec_comparison.is_significant
-            and not exec_comparison.practical_significance
-        )
-        memory_stat_only = (
-            memory_comparison.is_significant
-            and not memory_comparison.practical_significance
-        )
+        # Strong evidence requires both statistical and practical significance
+        exec_strong = exec_significant and exec_practical
+        memory_strong = memory_significant and memory_practical
 
-        # Check for practical significance only
-        exec_practical_only = (
-            not exec_comparison.is_significant
-            and exec_comparison.practical_significance
-        )
-        memory_practical_only = (
-            not memory_comparison.is_significant
-            and memory_comparison.practical_significance
-        )
+        if exec_strong and memory_strong:
+            return "Very High"
 
         if exec_strong or memory_strong:
             # At least one metric has strong evidence
-            if exec_strong and memory_strong:
-                return "Very High"
-            elif (
-                exec_comparison.effect_size.effect_size == EffectSize.LARGE
-                or memory_comparison.effect_size.effect_size == EffectSize.LARGE
-            ):
-                return "High"
-            else:
-                return "Medium-High"
-        elif (
-            exec_stat_only
-            or memory_stat_only
-            or exec_practical_only
-            or memory_practical_only
-        ):
-            # Some evidence but not conclusive
+            has_large_effect = EffectSize.LARGE in (
+                exec_comparison.effect_size.effect_size,
+                memory_comparison.effect_size.effect_size,
+            )
+            return "High" if has_large_effect else "Medium-High"
+
+        # Without strong evidence, any single kind of significance is partial evidence
+        if exec_significant or exec_practical or memory_significant or memory_practical:
             return "Medium"
-        else:
-            # Weak or no evidence
-            return "Low"
+
+        # Weak or no evidence
+        return "Low"
 
 
 def main():
@@ -1172,6 +1257,7 @@ def _perform_comparisons(
 
     print(f"🔍 Found {len(task_groups)} task-scale combinations for comparison")
 
+    comparison_inputs = []
     for (task, scale), language_results in task_groups.items():
         try:
             # Look for Rust and TinyGo implementations
@@ -1184,27 +1270,43 @@ def _perform_comparisons(
                 )
                 continue
 
-            # Perform statistical comparison
+            # Validate and extract samples; the t-tests run in one batch below
             print(f"📊 Comparing {task}_{scale}: Rust vs TinyGo...")
-            comparison_result = stats_engine.generate_task_comparison(
-                rust_result, tinygo_result
-            )
-            comparison_results.append(comparison_result)
-
-            # Log comparison summary
-            exec_effect = comparison_result.execution_time_comparison.effect_size
-            memory_effect = comparison_result.memory_usage_comparison.effect_size
-            print(
-                f"  ✓ Execution time effect: {exec_effect.effect_size.value} (d={exec_effect.cohens_d:.3f})"
-            )
-            print(
-                f"  ✓ Memory usage effect: {memory_effect.effect_size.value} (d={memory_effect.cohens_d:.3f})"
+            comparison_inputs.append(
+                stats_engine._prepare_task_comparison(rust_result, tinygo_result)
             )
 
         except Exception as e:
             print(f"❌ Error comparing {task}_{scale}: {e}")
             continue
 
+    # Perform statistical comparisons for all valid pairs at once; if the
+    # batch fails, redo it pair by pair so only the failing pairs are skipped
+    try:
+        comparison_results = stats_engine._complete_task_comparisons(comparison_inputs)
+    except Exception:
+        comparison_results = []
+        for inputs in comparison_inputs:
+            task, scale = inputs.rust_result.task, inputs.rust_result.scale
+            try:
+                comparison_results.extend(
+                    stats_engine._complete_task_comparisons([inputs])
+                )
+            except Exception as e:
+                print(f"❌ Error comparing {task}_{scale}: {e}")
+
+    for comparison_result in comparison_results:
+        # Log comparison summary
+        exec_effect = comparison_result.execution_time_comparison.effect_size
+        memory_effect = comparison_result.memory_usage_comparison.effect_size
+        print(f"  ✓ {comparison_result.task}_{comparison_result.scale}:")
+        print(
+            f"    Execution time effect: {exec_effect.effect_size.value} (d={exec_effect.cohens_d:.3f})"
+        )
+        print(
+            f"    Memory usage effect: {memory_effect.effect_size.value} (d={memory_effect.cohens_d:.3f})"
+        )
+
     print(f"✅ Completed {len(comparison_results)} statistical comparisons")
     return comparison_results
 
@@ -1242,10 +1344,11 @@ def _save_comparison_results(
             ),
         }
 
-        # Save main statistical report
+        # Save main statistical report; encoding to one string and writing it
+        # once avoids json.dump's per-token write calls
         report_path = output_dir / "statistical_analysis_report.json"
         with open(report_path, "w", encoding="utf-8") as f:
-            json.dump(statistical_report, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(statistical_report, indent=2, ensure_ascii=False))
         print(f"✅ Statistical analysis report saved to {report_path}")
 
         # Save individual comparison results for detailed analysis
@@ -1259,7 +1362,7 @@ def _save_comparison_results(
                 result, compact=False
             )  # Keep full detail for individual files
             with open(result_path, "w", encoding="utf-8") as f:
-                json.dump(detailed_result, f, indent=2, ensure_ascii=False)
+                f.write(json.dumps(detailed_result, indent=2, ensure_ascii=False))
 
         print(f"✅ Saved {len(comparison_results)} individual comparison files")
 
@@ -6,8 +6,9 @@ and result consistency checks. Focuses on engineering reliability over academic
 """
 
 import logging
-from collections import defaultdict
+from collections.abc import KeysView
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
 
 from . import common
@@ -21,8 +22,32 @@ from .data_models import (
 
 logger = logging.getLogger(__name__)
 
+# (task, scale, inputDataHash, resultHash) of a sample, read at C level
+_sample_hash_entry = attrgetter("task", "scale", "inputDataHash", "resultHash")
+
+# Raw sample keys and defaults for the BenchmarkSample fields after
+# task/language/scale
+_SAMPLE_FIELD_DEFAULTS = (
+    ("run", 0),
+    ("repetition", 1),
+    ("moduleId", ""),
+    ("inputDataHash", 0),
+    ("executionTime", 0.0),
+    ("memoryUsageMb", 0.0),
+    ("memoryUsed", 0),
+    ("wasmMemoryBytes", 0),
+    ("resultHash", 0),
+    ("timestamp", 0),
+    ("jsHeapBefore", 0),
+    ("jsHeapAfter", 0),
+    ("success", False),
+    ("implementation", ""),
+    ("resultDimensions", None),
+    ("recordsProcessed", None),
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class SampleData:
     """Extracted sample data for validation."""
 
@@ -46,7 +71,7 @@ class ValidationError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class LanguagePair:
     """Rust and TinyGo results for a task-scale combination."""
 
@@ -85,16 +110,21 @@ class BenchmarkValidator:
         if not benchmark_results:
             return []
 
-        # Group by (task, scale) using defaultdict for cleaner code
-        task_groups = defaultdict(list)
+        # Bucket by (task, scale) and language in a single pass; results for
+        # other languages keep their group but are not compared
+        task_groups: dict[tuple[str, str], dict[str, list[TaskResult]]] = {}
         for result in benchmark_results:
-            task_groups[(result.task, result.scale)].append(result)
+            language_results = task_groups.setdefault(
+                (result.task, result.scale), {"rust": [], "tinygo": []}
+            )
+            if result.language in language_results:
+                language_results[result.language].append(result)
 
         validation_results = []
-        for (task, scale), results in task_groups.items():
-            rust_results = [r for r in results if r.language == "rust"]
-            tinygo_results = [r for r in results if r.language == "tinygo"]
-            pair = LanguagePair(rust_results, tinygo_results, task, scale)
+        for (task, scale), language_results in task_groups.items():
+            pair = LanguagePair(
+                language_results["rust"], language_results["tinygo"], task, scale
+            )
             validation_results.append(self._validate_language_pair(pair))
         return validation_results
 
@@ -188,9 +218,19 @@ class BenchmarkValidator:
         issues = []
         base_result = results[0]
 
+        # The base entries and lookup are the same for every comparison, so
+        # build them once
+        base_entries = self._distinct_entries(base_result.samples)
+        base_issues: list[str] = []
+        base_lookup = self._build_hash_lookup(
+            base_result.samples, "primary", base_issues, base_entries
+        )
+
         for result in results[1:]:
             consistency = self._verify_cross_language_hash_match(
-                base_result.samples, result.samples
+                base_result.samples,
+                result.samples,
+                primary_lookup=(base_lookup, base_issues, base_entries),
             )
             if not consistency.is_consistent:
                 issues.append(
@@ -204,18 +244,16 @@ class BenchmarkValidator:
         if not task_result.samples:
             return SampleData()
 
-        # Use first successful sample with safe success checking
-        successful_samples = [
-            s for s in task_result.samples if hasattr(s, "success") and s.success
-        ]
-        if not successful_samples:
+        # Use first successful sample; stop at the first match instead of
+        # collecting every successful sample
+        sample = next((s for s in task_result.samples if s.success), None)
+        if sample is None:
             return SampleData()
 
-        sample = successful_samples[0]
         return SampleData(
             hash=sample.resultHash,
-            dimensions=getattr(sample, "resultDimensions", None),
-            records=getattr(sample, "recordsProcessed", None),
+            dimensions=sample.resultDimensions,
+            records=sample.recordsProcessed,
         )
 
     def _create_validation_result(
@@ -272,14 +310,15 @@ class BenchmarkValidator:
             )
 
         # Sample size validation
-        if len(rust_result.samples) < self.constants.MIN_SAMPLES:
+        min_samples = self.constants.MIN_SAMPLES
+        if len(rust_result.samples) < min_samples:
             issues.append(
-                f"Rust has insufficient samples: {len(rust_result.samples)} < {self.constants.MIN_SAMPLES}"
+                f"Rust has insufficient samples: {len(rust_result.samples)} < {min_samples}"
             )
 
-        if len(tinygo_result.samples) < self.constants.MIN_SAMPLES:
+        if len(tinygo_result.samples) < min_samples:
             issues.append(
-                f"TinyGo has insufficient samples: {len(tinygo_result.samples)} < {self.constants.MIN_SAMPLES}"
+                f"TinyGo has insufficient samples: {len(tinygo_result.samples)} < {min_samples}"
             )
 
         # Hash consistency validation
@@ -332,10 +371,14 @@ class BenchmarkValidator:
         self,
         primary_samples: list[BenchmarkSample],
         secondary_samples: list[BenchmarkSample],
+        primary_lookup: tuple[dict, list[str], set] | None = None,
     ) -> ConsistencyResult:
-        """Verify two language implementations produce identical result hashes."""
-        issues = []
+        """Verify two language implementations produce identical result hashes.
 
+        primary_lookup optionally supplies the (lookup, issues, entries) already
+        built for primary_samples, so repeated checks against one reference
+        reuse it.
+        """
         # Early validation
         if not primary_samples or not secondary_samples:
             missing = []
@@ -346,21 +389,39 @@ class BenchmarkValidator:
             return ConsistencyResult(is_consistent=False, issues=missing)
 
         # Build hash lookup tables efficiently
-        primary_lookup = self._build_hash_lookup(primary_samples, "primary", issues)
+        if primary_lookup is None:
+            primary_entries = self._distinct_entries(primary_samples)
+            primary_issues: list[str] = []
+            primary_table = self._build_hash_lookup(
+                primary_samples, "primary", primary_issues, primary_entries
+            )
+        else:
+            primary_table, primary_issues, primary_entries = primary_lookup
+        secondary_entries = self._distinct_entries(secondary_samples)
+
+        # Fast path: the same distinct (test case, hash) entries on both sides,
+        # with one hash per test case, cannot produce any issue
+        if primary_entries == secondary_entries and len(primary_table) == len(
+            primary_entries
+        ):
+            return ConsistencyResult(is_consistent=True, issues=[])
+
+        issues = list(primary_issues)
         secondary_lookup = self._build_hash_lookup(
-            secondary_samples, "secondary", issues
+            secondary_samples, "secondary", issues, secondary_entries
         )
 
         # Compare test case coverage
-        primary_keys = set(primary_lookup.keys())
-        secondary_keys = set(secondary_lookup.keys())
+        # Key views support set operations without copying into new sets
+        primary_keys = primary_table.keys()
+        secondary_keys = secondary_lookup.keys()
 
         self._check_test_coverage(primary_keys, secondary_keys, issues)
 
         # Compare hash values for common test cases
         common_keys = primary_keys & secondary_keys
         hash_mismatches = self._compare_hashes(
-            primary_lookup, secondary_lookup, common_keys, issues
+            primary_table, secondary_lookup, common_keys, issues
         )
 
         # Apply tolerance threshold
@@ -377,39 +438,56 @@ class BenchmarkValidator:
             is_consistent=hash_mismatches == 0 and not issues, issues=issues
         )
 
+    def _distinct_entries(self, samples: list[BenchmarkSample]) -> set:
+        """Collect distinct (task, scale, inputDataHash, resultHash) entries."""
+        return set(map(_sample_hash_entry, samples))
+
     def _build_hash_lookup(
-        self, samples: list[BenchmarkSample], label: str, issues: list[str]
+        self,
+        samples: list[BenchmarkSample],
+        label: str,
+        issues: list[str],
+        entries: set,
     ) -> dict:
         """Build hash lookup table and detect internal inconsistencies."""
+        # Fast path: the distinct entries collapse repeated runs without a
+        # per-sample Python loop; one hash per test case means no conflicts
+        lookup = {
+            (task, scale, input_hash): result_hash
+            for task, scale, input_hash, result_hash in entries
+        }
+        if len(lookup) == len(entries):
+            return lookup
+
+        # Conflicting hashes: rescan in sample order to report each one
         lookup = {}
         for sample in samples:
             key = (sample.task, sample.scale, sample.inputDataHash)
-            if key in lookup and lookup[key] != sample.resultHash:
+            # The first hash seen for a test case is the reference
+            first_hash = lookup.setdefault(key, sample.resultHash)
+            if first_hash != sample.resultHash:
                 issues.append(
-                    f"Inconsistent {label} results for {key}: {lookup[key]} vs {sample.resultHash}"
+                    f"Inconsistent {label} results for {key}: {first_hash} vs {sample.resultHash}"
                 )
-            else:
-                lookup[key] = sample.resultHash
         return lookup
 
     def _check_test_coverage(
-        self, primary_keys: set, secondary_keys: set, issues: list[str]
+        self, primary_keys: KeysView, secondary_keys: KeysView, issues: list[str]
     ) -> None:
         """Check for missing test cases between implementations."""
-        missing_in_secondary = primary_keys - secondary_keys
-        missing_in_primary = secondary_keys - primary_keys
-
-        for key in missing_in_secondary:
-            task, scale, input_hash = key
-            issues.append(
-                f"Test case missing in secondary: task={task}, scale={scale}, inputHash={input_hash}"
-            )
-
-        for key in missing_in_primary:
-            task, scale, input_hash = key
-            issues.append(
-                f"Test case missing in primary: task={task}, scale={scale}, inputHash={input_hash}"
-            )
+        # Full coverage is the expected case; one equality check replaces
+        # materializing two empty set differences
+        if primary_keys == secondary_keys:
+            return
+
+        issues.extend(
+            f"Test case missing in secondary: task={task}, scale={scale}, inputHash={input_hash}"
+            for task, scale, input_hash in primary_keys - secondary_keys
+        )
+        issues.extend(
+            f"Test case missing in primary: task={task}, scale={scale}, inputHash={input_hash}"
+            for task, scale, input_hash in secondary_keys - primary_keys
+        )
 
     def _compare_hashes(
         self,
@@ -498,32 +576,29 @@ def _convert_raw_data_to_task_results(raw_data: dict) -> list[TaskResult]:
     for result_data in raw_results:
         samples = _convert_raw_samples_to_benchmark_samples(result_data)
 
-        # Group samples by task-language-scale combination
-        task_groups = {}
+        # Group samples by task-language-scale combination in one pass,
+        # keeping only successful samples alongside the attempt count
+        attempts: dict[tuple[str, str, str], int] = {}
+        successful_groups: dict[tuple[str, str, str], list[BenchmarkSample]] = {}
         for sample in samples:
             key = (sample.task, sample.language, sample.scale)
-            if key not in task_groups:
-                task_groups[key] = []
-            task_groups[key].append(sample)
+            attempts[key] = attempts.get(key, 0) + 1
+            successful_samples = successful_groups.setdefault(key, [])
+            if sample.success:
+                successful_samples.append(sample)
 
         # Create TaskResult for each group
-        for (task, language, scale), group_samples in task_groups.items():
-            successful_samples = [s for s in group_samples if s.success]
-            failed_samples = [s for s in group_samples if not s.success]
-
-            total_attempts = len(group_samples)
-            success_rate = (
-                len(successful_samples) / total_attempts if total_attempts > 0 else 0.0
-            )
-
+        for (task, language, scale), total_attempts in attempts.items():
+            successful_samples = successful_groups[(task, language, scale)]
+            successful_runs = len(successful_samples)
             task_result = TaskResult(
                 task=task,
                 language=language,
                 scale=scale,
                 samples=successful_samples,
-                successful_runs=len(successful_samples),
-                failed_runs=len(failed_samples),
-                success_rate=success_rate,
+                successful_runs=successful_runs,
+                failed_runs=total_attempts - successful_runs,
+                success_rate=successful_runs / total_attempts,
             )
             task_results.append(task_result)
 
@@ -555,28 +630,18 @@ def _convert_raw_samples_to_benchmark_samples(
                 continue
 
             # Use group-level metadata for samples that don't have their own
-            sample = BenchmarkSample(
-                task=sample_data.get("task", task),
-                language=sample_data.get("language", language),
-                scale=sample_data.get("scale", scale),
-                run=sample_data.get("run", 0),
-                repetition=sample_data.get("repetition", 1),
-                moduleId=sample_data.get("moduleId", ""),
-                inputDataHash=sample_data.get("inputDataHash", 0),
-                executionTime=sample_data.get("executionTime", 0.0),
-                memoryUsageMb=sample_data.get("memoryUsageMb", 0.0),
-                memoryUsed=sample_data.get("memoryUsed", 0),
-                wasmMemoryBytes=sample_data.get("wasmMemoryBytes", 0),
-                resultHash=sample_data.get("resultHash", 0),
-                timestamp=sample_data.get("timestamp", 0),
-                jsHeapBefore=sample_data.get("jsHeapBefore", 0),
-                jsHeapAfter=sample_data.get("jsHeapAfter", 0),
-                success=sample_data.get("success", False),
-                implementation=sample_data.get("implementation", ""),
-                resultDimensions=sample_data.get("resultDimensions"),
-                recordsProcessed=sample_data.get("recordsProcessed"),
+            get = sample_data.get
+            samples.append(
+                BenchmarkSample(
+                    task=get("task", task),
+                    language=get("language", language),
+                    scale=get("scale", scale),
+                    **{
+                        key: get(key, default)
+                        for key, default in _SAMPLE_FIELD_DEFAULTS
+                    },
+                )
             )
-            samples.append(sample)
 
     return samples
 
@@ -635,8 +700,9 @@ def _save_validation_report(output_dir: Path, validation_report: dict) -> None:
         report_path = output_dir / "validation_report.json"
         report_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Encode once and write once rather than one write call per token
         with open(report_path, "w", encoding="utf-8") as f:
-            json.dump(validation_report, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(validation_report, indent=2, ensure_ascii=False))
 
         logger.info(f"Validation report saved to {report_path}")
         print(f"✅ Validation report saved to {report_path}")
@@ -659,9 +725,11 @@ def _print_validation_summary(
     validation_results: list[ValidationResult], output_dir: Path
 ) -> None:
     """Print comprehensive validation summary."""
+    # One pass over the results yields both the failure details and counts
+    failed_results = [r for r in validation_results if not r.validation_passed]
     total_validations = len(validation_results)
-    passed_validations = len([r for r in validation_results if r.validation_passed])
-    failed_validations = total_validations - passed_validations
+    failed_validations = len(failed_results)
+    passed_validations = total_validations - failed_validations
 
     print("\n📊 Validation Summary:")
     print(f"   • Total Validations: {total_validations}")
@@ -672,7 +740,6 @@ def _print_validation_summary(
         print(f"   • Success Rate: {success_rate:.1%}")
 
     # Show failed validations details
-    failed_results = [r for r in validation_results if not r.validation_passed]
     if failed_results:
         print("\n⚠️  Failed Validations:")
         for result in failed_results[:5]:  # Show first 5 failures
@@ -0,0 +1,187 @@
+"""Unit tests for the statistical analysis engine."""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from analysis.data_models import (
+    BenchmarkSample,
+    CleanedDataset,
+    EffectSize,
+    StatisticsConfiguration,
+    TaskResult,
+)
+from analysis.statistics import StatisticalAnalysis, _perform_comparisons
+
+# (group1, group2) pairs covering regular data, n < 2 and zero variance
+GROUP_PAIRS = [
+    ([1.0, 2.0, 3.5, 4.0, 2.2], [2.0, 2.5, 3.9, 4.4, 5.0, 6.1]),
+    ([10.0, 10.4, 9.8, 10.1], [10.2, 10.3, 10.0, 10.6, 10.1]),
+    ([1.0], [2.0, 3.0]),
+    ([4.0, 5.0], [7.0]),
+    ([2.0, 2.0, 2.0], [2.0, 2.0]),
+    ([2.0, 2.0, 2.0], [3.0, 3.0, 3.0]),
+    ([5.0, 5.0, 5.0], [4.0, 6.0, 5.5]),
+]
+
+
+def make_task_result(
+    task: str, language: str, scale: str, exec_times: list[float]
+) -> TaskResult:
+    samples = [
+        BenchmarkSample(
+            task=task,
+            language=language,
+            scale=scale,
+            run=run,
+            repetition=1,
+            moduleId=f"{task}-{language}",
+            inputDataHash=1,
+            executionTime=exec_time,
+            memoryUsageMb=1.0,
+            memoryUsed=1024 * (run % 3 + 1),
+            wasmMemoryBytes=65536,
+            resultHash=1,
+            timestamp=0,
+            jsHeapBefore=0,
+            jsHeapAfter=0,
+            success=True,
+            implementation=language,
+        )
+        for run, exec_time in enumerate(exec_times)
+    ]
+    return TaskResult(
+        task=task,
+        language=language,
+        scale=scale,
+        samples=samples,
+        successful_runs=len(samples),
+        failed_runs=0,
+        success_rate=1.0,
+    )
+
+
+@pytest.fixture
+def engine() -> StatisticalAnalysis:
+    return StatisticalAnalysis(
+        StatisticsConfiguration(
+            confidence_level=0.95,
+            significance_alpha=0.05,
+            effect_size_thresholds={"small": 0.2, "medium": 0.5, "large": 0.8},
+            minimum_detectable_effect=0.3,
+        )
+    )
+
+
+class TestClassifyEffectSize:
+    @pytest.mark.parametrize(
+        ("cohen_d", "expected"),
+        [
+            (0.0, EffectSize.NEGLIGIBLE),
+            (0.19, EffectSize.NEGLIGIBLE),
+            (0.2, EffectSize.SMALL),
+            (0.49, EffectSize.SMALL),
+            (0.5, EffectSize.MEDIUM),
+            (0.79, EffectSize.MEDIUM),
+            (0.8, EffectSize.LARGE),
+            (-0.8, EffectSize.LARGE),
+            (-0.5, EffectSize.MEDIUM),
+        ],
+    )
+    def test_thresholds_are_inclusive(self, engine, cohen_d, expected):
+        assert engine._classify_effect_size(cohen_d) is expected
+
+    def test_nan_is_negligible(self, engine):
+        assert engine._classify_effect_size(float("nan")) is EffectSize.NEGLIGIBLE
+
+    def test_unordered_thresholds_check_large_first(self, engine):
+        engine.effect_thresholds = {"small": 0.9, "medium": 0.5, "large": 0.3}
+
+        assert engine._classify_effect_size(0.4) is EffectSize.LARGE
+        assert engine._classify_effect_size(0.1) is EffectSize.NEGLIGIBLE
+
+    def test_cohens_d_uses_inclusive_boundary(self, engine):
+        # Means differ by 1 with a pooled standard deviation of 2, so |d| is 0.5
+        result = engine.cohens_d([0.0, 2.0, 4.0], [1.0, 3.0, 5.0])
+
+        assert result.magnitude == 0.5
+        assert result.effect_size is EffectSize.MEDIUM
+
+
+class TestBatchedComparisons:
+    @pytest.fixture
+    def group_stats(self, engine):
+        return [
+            (engine._get_basic_stats(group1), engine._get_basic_stats(group2))
+            for group1, group2 in GROUP_PAIRS
+        ]
+
+    def test_welch_t_tests_match_single_pair(self, engine, group_stats):
+        expected = [
+            engine.welch_t_test(group1, group2) for group1, group2 in GROUP_PAIRS
+        ]
+
+        assert engine._welch_t_tests(group_stats) == expected
+
+    def test_effect_sizes_match_single_pair(self, engine, group_stats):
+        expected = [engine.cohens_d(group1, group2) for group1, group2 in GROUP_PAIRS]
+
+        assert engine._effect_sizes(group_stats) == expected
+
+    def test_single_pair_matches_scipy(self, engine):
+        group1, group2 = GROUP_PAIRS[0]
+        reference = stats.ttest_ind(group1, group2, equal_var=False)
+
+        result = engine.welch_t_test(group1, group2)
+
+        assert result.t_statistic == pytest.approx(reference.statistic)
+        assert result.p_value == pytest.approx(reference.pvalue)
+
+    def test_insufficient_samples_are_neutral(self, engine):
+        t_test = engine.welch_t_test([1.0], [2.0, 3.0])
+        effect = engine.cohens_d([1.0], [2.0, 3.0])
+
+        assert (t_test.t_statistic, t_test.p_value, t_test.is_significant) == (
+            0.0,
+            1.0,
+            False,
+        )
+        assert t_test.mean_difference == -1.5
+        assert (effect.cohens_d, effect.effect_size) == (0.0, EffectSize.NEGLIGIBLE)
+
+    def test_zero_variance_rows(self, engine):
+        identical = engine.welch_t_test([2.0, 2.0, 2.0], [2.0, 2.0])
+        shifted = engine.welch_t_test([2.0, 2.0, 2.0], [3.0, 3.0, 3.0])
+        effect = engine.cohens_d([2.0, 2.0, 2.0], [3.0, 3.0, 3.0])
+
+        assert (identical.t_statistic, identical.p_value) == (0.0, 1.0)
+        assert (shifted.t_statistic, shifted.p_value) == (0.0, 1.0)
+        assert effect.cohens_d == 0.0
+        assert np.isfinite(effect.pooled_std)
+
+    def test_failing_pair_keeps_rest_of_batch(self, engine, monkeypatch, capsys):
+        rng = np.random.default_rng(0)
+        task_results = [
+            make_task_result(task, language, "small", list(rng.uniform(9, 11, 20)))
+            for task in ("mandelbrot", "json_parse", "matrix_mul")
+            for language in ("rust", "tinygo")
+        ]
+        build_comparison_result = engine._build_comparison_result
+
+        def failing_build(inputs, exec_analysis, memory_analysis):
+            if inputs.rust_result.task == "json_parse":
+                raise RuntimeError("boom")
+            return build_comparison_result(inputs, exec_analysis, memory_analysis)
+
+        monkeypatch.setattr(engine, "_build_comparison_result", failing_build)
+
+        results = _perform_comparisons(
+            CleanedDataset(task_results, removed_outliers=[], cleaning_log=[]), engine
+        )
+
+        assert [result.task for result in results] == ["mandelbrot", "matrix_mul"]
+        assert "❌ Error comparing json_parse_small: boom" in capsys.readouterr().out
+        monkeypatch.undo()
+        for result in results:
+            pair = [r for r in task_results if r.task == result.task]
+            assert result == engine.generate_task_comparison(*pair)
@@ -0,0 +1,187 @@
+"""Unit tests for cross-language hash validation."""
+
+import pytest
+
+from analysis.data_models import (
+    BenchmarkSample,
+    TaskResult,
+    ValidationConfiguration,
+)
+from analysis.validation import BenchmarkValidator
+
+
+def make_samples(
+    language: str, hashes: list[tuple[int, int]], task: str = "mandelbrot"
+) -> list[BenchmarkSample]:
+    """Build samples from (inputDataHash, resultHash) pairs in run order."""
+    return [
+        BenchmarkSample(
+            task=task,
+            language=language,
+            scale="small",
+            run=run,
+            repetition=1,
+            moduleId=f"{task}-{language}",
+            inputDataHash=input_hash,
+            executionTime=1.0,
+            memoryUsageMb=1.0,
+            memoryUsed=1024,
+            wasmMemoryBytes=65536,
+            resultHash=result_hash,
+            timestamp=0,
+            jsHeapBefore=0,
+            jsHeapAfter=0,
+            success=True,
+            implementation=language,
+        )
+        for run, (input_hash, result_hash) in enumerate(hashes)
+    ]
+
+
+def make_task_result(language: str, hashes: list[tuple[int, int]]) -> TaskResult:
+    samples = make_samples(language, hashes)
+    return TaskResult(
+        task="mandelbrot",
+        language=language,
+        scale="small",
+        samples=samples,
+        successful_runs=len(samples),
+        failed_runs=0,
+        success_rate=1.0,
+    )
+
+
+@pytest.fixture
+def validator() -> BenchmarkValidator:
+    return BenchmarkValidator(ValidationConfiguration())
+
+
+class TestBuildHashLookup:
+    def test_one_hash_per_test_case(self, validator):
+        samples = make_samples("rust", [(1, 10), (2, 20), (1, 10), (2, 20)])
+        issues = []
+
+        lookup = validator._build_hash_lookup(
+            samples, "primary", issues, validator._distinct_entries(samples)
+        )
+
+        assert lookup == {
+            ("mandelbrot", "small", 1): 10,
+            ("mandelbrot", "small", 2): 20,
+        }
+        assert issues == []
+
+    def test_conflicting_replicates_keep_first_hash(self, validator):
+        samples = make_samples("rust", [(1, 10), (2, 20), (1, 11), (1, 12)])
+        issues = []
+
+        lookup = validator._build_hash_lookup(
+            samples, "primary", issues, validator._distinct_entries(samples)
+        )
+
+        assert lookup == {
+            ("mandelbrot", "small", 1): 10,
+            ("mandelbrot", "small", 2): 20,
+        }
+        assert issues == [
+            "Inconsistent primary results for ('mandelbrot', 'small', 1): 10 vs 11",
+            "Inconsistent primary results for ('mandelbrot', 'small', 1): 10 vs 12",
+        ]
+
+
+class TestVerifyCrossLanguageHashMatch:
+    def test_matching_entry_sets_skip_secondary_lookup(self, validator, monkeypatch):
+        primary = make_samples("rust", [(1, 10), (2, 20), (1, 10)])
+        secondary = make_samples("tinygo", [(2, 20), (1, 10)])
+        build_hash_lookup = validator._build_hash_lookup
+        labels = []
+
+        def tracking_build(samples, label, issues, entries):
+            labels.append(label)
+            return build_hash_lookup(samples, label, issues, entries)
+
+        monkeypatch.setattr(validator, "_build_hash_lookup", tracking_build)
+
+        result = validator._verify_cross_language_hash_match(primary, secondary)
+
+        assert (result.is_consistent, result.issues) == (True, [])
+        assert labels == ["primary"]
+
+    def test_conflicting_replicates_on_both_sides(self, validator):
+        hashes = [(1, 10), (1, 11), (2, 20)]
+        primary = make_samples("rust", hashes)
+        secondary = make_samples("tinygo", hashes)
+
+        result = validator._verify_cross_language_hash_match(primary, secondary)
+
+        assert not result.is_consistent
+        assert result.issues == [
+            "Inconsistent primary results for ('mandelbrot', 'small', 1): 10 vs 11",
+            "Inconsistent secondary results for ('mandelbrot', 'small', 1): 10 vs 11",
+        ]
+
+    def test_hash_mismatch_and_missing_test_case(self, validator):
+        primary = make_samples("rust", [(1, 10), (2, 20)])
+        secondary = make_samples("tinygo", [(1, 10), (2, 21), (3, 30)])
+
+        result = validator._verify_cross_language_hash_match(primary, secondary)
+
+        assert not result.is_consistent
+        assert result.issues == [
+            "Test case missing in primary: task=mandelbrot, scale=small, inputHash=3",
+            "Hash mismatch for task=mandelbrot, scale=small, inputHash=2: primary=20, secondary=21",
+            "Hash mismatch rate 50.0% exceeds tolerance 5.0%",
+        ]
+
+    @pytest.mark.parametrize(
+        "secondary_hashes",
+        [
+            [(1, 10), (2, 20)],
+            [(1, 10), (2, 21)],
+            [(1, 10), (1, 11)],
+            [(2, 20), (3, 30)],
+        ],
+    )
+    def test_primary_lookup_reuse_matches_fresh_build(
+        self, validator, secondary_hashes
+    ):
+        primary = make_samples("rust", [(1, 10), (2, 20), (1, 12)])
+        secondary = make_samples("tinygo", secondary_hashes)
+        entries = validator._distinct_entries(primary)
+        issues = []
+        lookup = validator._build_hash_lookup(primary, "primary", issues, entries)
+
+        reused = validator._verify_cross_language_hash_match(
+            primary, secondary, primary_lookup=(lookup, issues, entries)
+        )
+
+        assert reused == validator._verify_cross_language_hash_match(primary, secondary)
+        # The supplied issues list is shared across calls and must not grow
+        assert issues == [
+            "Inconsistent primary results for ('mandelbrot', 'small', 1): 10 vs 12"
+        ]
+
+
+class TestCheckInternalConsistency:
+    def test_base_lookup_is_built_once(self, validator, monkeypatch):
+        results = [
+            make_task_result("rust", [(1, 10), (2, 20)]),
+            make_task_result("rust", [(1, 10), (2, 20)]),
+            make_task_result("rust", [(1, 10), (2, 21)]),
+            make_task_result("rust", [(1, 10)]),
+        ]
+        build_hash_lookup = validator._build_hash_lookup
+        labels = []
+
+        def tracking_build(samples, label, issues, entries):
+            labels.append(label)
+            return build_hash_lookup(samples, label, issues, entries)
+
+        monkeypatch.setattr(validator, "_build_hash_lookup", tracking_build)
+
+        issues = validator._check_internal_consistency(results, "rust")
+
+        assert labels == ["primary", "secondary", "secondary"]
+        assert len(issues) == 2
+        assert "inputHash=2: primary=20, secondary=21" in issues[0]
+        assert "Test case missing in secondary" in issues[1]